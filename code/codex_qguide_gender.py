@@ -17,23 +17,44 @@ as a single string, e.g.:
         --harvard-q-cookie \"SMSESSION=...; BIGipServer=...\" \\
         --input 2025springQ.csv
 
-Dependencies: requests, beautifulsoup4, gender-guesser
+Dependencies: httpx[http2], beautifulsoup4, lxml, gender-guesser
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import csv
+import functools
+import itertools
 import logging
 import os
 import re
+import sqlite3
 import sys
+import tempfile
 import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from email.utils import parsedate_to_datetime
+from html import unescape
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import (
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlsplit
 
-import requests
-from bs4 import BeautifulSoup, NavigableString
+import httpx
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 
 try:
     from gender_guesser.detector import Detector
@@ -93,6 +114,14 @@ DEFAULT_COOKIE = (
     "session_token=2695601b49754c9eae1872450af0bfe6"
 )
 
+FIRST_NAME_COLUMN = "course_teacher_first_name"
+SEX_COLUMN = "course_teacher_sex"
+# Upper bound on rows buffered between the CSV reader, workers and writer.
+ROW_QUEUE_SIZE = 256
+# Rows are written one at a time, so batch them into large writes to disk.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
 def build_gender_detector() -> Optional["Detector"]:
     if Detector is None:
         logging.warning(
@@ -106,16 +135,59 @@ def build_gender_detector() -> Optional["Detector"]:
         return None
 
 
-def guess_sex(first_name: str, detector: Optional["Detector"]) -> str:
-    if not first_name or not detector:
-        return ""
-    gender = detector.get_gender(first_name)
+@functools.lru_cache(maxsize=4096)
+def _detect_gender(name: str, detector: "Detector") -> str:
+    # Instructors teach many sections, so the same names recur across rows.
+    return detector.get_gender(name)
+
+
+# Splits compound first names such as "Anne-Marie", "Mary Beth" or "JoAnn".
+NAME_TOKEN_SPLIT = re.compile(r"[\s\-]+|(?<=[a-z])(?=[A-Z])")
+
+
+def _sex_from_gender(gender: str) -> str:
     if gender in {"male", "mostly_male"}:
         return "male"
     if gender in {"female", "mostly_female"}:
         return "female"
     return "unknown"
 
+
+def guess_sex(first_name: str, detector: Optional["Detector"]) -> str:
+    if not first_name or not detector:
+        return ""
+    return _guess_sex_cached(first_name, detector)
+
+
+@functools.lru_cache(maxsize=4096)
+def _guess_sex_cached(first_name: str, detector: "Detector") -> str:
+    # Rows are annotated once per distinct first name; repeats skip the
+    # tokenizing and voting below as well as the detector lookups.
+    sex = _sex_from_gender(_detect_gender(first_name.lower(), detector))
+    if sex != "unknown":
+        return sex
+    # Fall back to a strict majority vote over the parts of a compound name.
+    tokens = [token for token in NAME_TOKEN_SPLIT.split(first_name) if token]
+    if len(tokens) < 2:
+        return sex
+    votes = Counter(
+        _sex_from_gender(_detect_gender(token.lower(), detector)) for token in tokens
+    )
+    sex, count = votes.most_common(1)[0]
+    if sex != "unknown" and count * 2 > len(tokens):
+        return sex
+    return "unknown"
+
+def _non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {value}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Add instructor first names to the Harvard Q CSV."
@@ -151,7 +223,10 @@ def parse_args() -> argparse.Namespace:
         "--delay",
         type=float,
         default=0.5,
-        help="Seconds to wait between HTTP requests (default: %(default)s).",
+        help=(
+            "Seconds to wait between HTTP requests to the same host "
+            "(default: %(default)s)."
+        ),
     )
     parser.add_argument(
         "--max-retries",
@@ -160,9 +235,33 @@ def parse_args() -> argparse.Namespace:
         help="Maximum retries per request before giving up (default: %(default)s).",
     )
     parser.add_argument(
-        "--limit",
+        "--concurrency",
         type=int,
-        help="Only process the first N rows (useful for quick tests).",
+        default=32,
+        help="Maximum number of Harvard Q requests in flight (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--cache-path",
+        help=(
+            "SQLite file used to cache fetched Harvard Q pages. Defaults to "
+            "harvard_q_cache.sqlite3 next to the input CSV."
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=7.0,
+        help="Days before a cached page is fetched again (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read from nor write to the on-disk page cache.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=_non_negative_int,
+        help="Only process and write the first N rows (useful for quick tests).",
     )
     parser.add_argument(
         "--log-level",
@@ -181,16 +280,15 @@ class HarvardQResolver:
     """Fetches Harvard Q report pages and extracts instructor first names."""
 
     LETTER_CLASS = r"[^\W\d_]"
-    KEYWORD_PATTERNS = [
-        re.compile(pattern, re.IGNORECASE)
-        for pattern in (
-            r"Instructor",
-            r"Instructors",
-            r"Course\s*Head",
-            r"Primary\s+Instructor",
-            r"Lecturer",
-        )
-    ]
+    KEYWORD_RE = re.compile(
+        r"(?i)\b(Instructors?|Course\s*Heads?|Primary\s+Instructors?|Lecturers?)\b"
+    )
+    # Matches "Instructor: Jane Doe" style labels directly in the raw HTML so
+    # most pages never need a parsed tree.
+    CONTEXT_RE = re.compile(
+        r"(?i)(?:Instructor|Course\s*Head|Primary\s+Instructor|Lecturer)s?"
+        r"\s*[:\-]?\s*(?P<ctx>[^<\n\r]{1,300})"
+    )
     STRUCTURED_HINTS = (
         "feedback",
         "instructor",
@@ -198,7 +296,20 @@ class HarvardQResolver:
         "primary instructor",
         "lecturer",
     )
-    INVALID_FIRST_TOKENS = {
+    # The candidate-chunk pass only builds these elements (and their
+    # descendants), so scripts, styles and hidden form state never become DOM
+    # nodes. The whole-page fallback parses without it so no text is lost.
+    PARSE_ONLY = SoupStrainer(
+        ["title", "h1", "h2", "h3", "span", "div", "td", "th", "p", "li", "label"]
+    )
+    # Pages at least this long are parsed in a worker process; smaller ones
+    # are cheaper to parse inline than to ship across processes.
+    PARSE_OFFLOAD_CHARS = 32_000
+    # Hosts that serve the HarvardKey sign-in page an expired session lands on.
+    LOGIN_HOSTS = frozenset({"key.harvard.edu"})
+    # Seconds before a URL that produced no first name is looked up again.
+    NEGATIVE_CACHE_TTL = 300.0
+    INVALID_FIRST_TOKENS: ClassVar[frozenset[str]] = frozenset({
         "professor",
         "prof",
         "doctor",
@@ -212,113 +323,334 @@ class HarvardQResolver:
         "chair",
         "director",
         "instructor",
-    }
+    })
 
     def __init__(
         self,
         cookie_header: Optional[str],
         delay: float = 0.5,
         max_retries: int = 3,
+        concurrency: int = 32,
+        cache_path: Optional[Path] = None,
+        cache_ttl: float = 7 * 24 * 3600,
     ) -> None:
         self.cookie_header = cookie_header or ""
         self.delay = delay if delay >= 0 else 0.0
         self.max_retries = max(1, max_retries)
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "HarvardQFirstNameFetcher/1.0 (+https://github.com/)",
-                "Accept-Language": "en-US,en;q=0.9",
-            }
+        self.concurrency = max(1, concurrency)
+        self.headers = {
+            "User-Agent": "HarvardQFirstNameFetcher/1.0 (+https://github.com/)",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Requests to the same host are spaced by that host's interval, which
+        # starts at `delay` and grows when the server asks us to slow down.
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next_ok: Dict[str, float] = {}
+        self._host_interval: Dict[str, float] = {}
+        # One task per (url, last name): concurrent rows for the same
+        # instructor and report await the same lookup. The extracted name
+        # depends on the last name, so rows that share a link but list another
+        # instructor get their own entry. Each entry carries the monotonic
+        # time after which an empty result may be retried, so a transient
+        # failure does not stick for the run.
+        self._link_cache: Dict[
+            Tuple[str, str], Tuple["asyncio.Future[Optional[str]]", float]
+        ] = {}
+        # Page downloads in flight, so those entries still share one request
+        # per URL. Finished downloads are dropped to keep page bodies out of
+        # memory; the SQLite cache serves repeats.
+        self._page_fetches: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        self.cache_ttl = max(0.0, cache_ttl)
+        self._page_cache: Optional[sqlite3.Connection] = None
+        if cache_path is not None:
+            self._page_cache = sqlite3.connect(str(cache_path))
+            self._page_cache.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, status INTEGER, body BLOB, fetched_at REAL)"
+            )
+            self._page_cache.commit()
+        self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    def close(self) -> None:
+        if self._page_cache is not None:
+            self._page_cache.close()
+            self._page_cache = None
+        self._parse_pool.shutdown(cancel_futures=True)
+
+    @contextlib.asynccontextmanager
+    async def connect(self) -> AsyncIterator["HarvardQResolver"]:
+        """Open the HTTP client that `resolve` uses for the duration of the block."""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        # HTTP/2 multiplexes concurrent requests over one kept-alive TLS
+        # connection per host; the pool only grows for HTTP/1.1 servers.
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=16,
+            keepalive_expiry=60,
         )
-        self._link_cache: Dict[str, Optional[str]] = {}
+        headers = dict(self.headers, Cookie=self.cookie_header)
+        # Blue report links redirect (redi=1), and an expired session redirects
+        # to HarvardKey, so redirects must be followed like requests did.
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=limits,
+            timeout=30.0,
+            follow_redirects=True,
+        ) as client:
+            self._client = client
+            try:
+                yield self
+            finally:
+                self._client = None
 
-    def resolve(self, url: str, last_name: str) -> Optional[str]:
+    async def resolve(self, url: str, last_name: str) -> Optional[str]:
         url = (url or "").strip()
         if not url:
             return None
-        if url in self._link_cache:
-            return self._link_cache[url]
+        key = (url, self._normalize_last_name(last_name).lower())
+        entry = self._link_cache.get(key)
+        if entry is None or self._is_expired_miss(*entry):
+            task = asyncio.ensure_future(self._resolve_uncached(url, last_name))
+            # The retry window starts when the lookup finishes, not when it
+            # was queued behind the semaphore, host lock or Retry-After.
+            self._link_cache[key] = (task, float("inf"))
+            task.add_done_callback(functools.partial(self._stamp_expiry, key))
+        else:
+            task = entry[0]
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self._link_cache.get(key, (None,))[0] is task:
+                del self._link_cache[key]
+            raise
+
+    def _stamp_expiry(
+        self, key: Tuple[str, str], task: "asyncio.Future[Optional[str]]"
+    ) -> None:
+        if self._link_cache.get(key, (None,))[0] is task:
+            self._link_cache[key] = (task, time.monotonic() + self.NEGATIVE_CACHE_TTL)
+
+    @staticmethod
+    def _is_expired_miss(task: "asyncio.Future[Optional[str]]", expires_at: float) -> bool:
+        if not task.done() or task.cancelled() or task.exception() is not None:
+            return False
+        return task.result() is None and time.monotonic() >= expires_at
+
+    async def _resolve_uncached(self, url: str, last_name: str) -> Optional[str]:
         if not self.cookie_header:
             logging.debug("No Harvard Q cookie provided; skipping %s", url)
-            self._link_cache[url] = None
             return None
-        html = self._fetch(url)
+        html = await self._fetch(url)
         if not html:
-            self._link_cache[url] = None
             return None
-        first = self._extract_first_name(html, last_name)
+        if len(html) >= self.PARSE_OFFLOAD_CHARS:
+            loop = asyncio.get_running_loop()
+            first = await loop.run_in_executor(
+                self._parse_pool, extract_first_name, html, last_name
+            )
+        else:
+            first = self._extract_first_name(html, last_name)
         if first:
             logging.debug("Resolved %s as %s %s", url, first, last_name)
         else:
             logging.debug("Unable to parse first name for %s", url)
-        self._link_cache[url] = first
         return first
 
-    def _fetch(self, url: str) -> Optional[str]:
-        headers = {"Cookie": self.cookie_header}
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                response = self.session.get(url, headers=headers, timeout=30)
-            except requests.RequestException as exc:
-                logging.warning("Request failed (%s/%s): %s", attempt, self.max_retries, exc)
-                self._sleep_backoff(attempt)
-                continue
-            if self.delay:
-                time.sleep(self.delay)
-            if response.status_code != 200:
-                logging.warning(
-                    "Received HTTP %s for %s (attempt %s/%s)",
-                    response.status_code,
-                    url,
-                    attempt,
-                    self.max_retries,
-                )
-                if response.status_code in {401, 403}:
-                    logging.error("Authentication failed for %s. Check your cookie.", url)
+    async def _fetch(self, url: str) -> Optional[str]:
+        fetch = self._page_fetches.get(url)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_once(url))
+            self._page_fetches[url] = fetch
+            fetch.add_done_callback(lambda _: self._page_fetches.pop(url, None))
+        return await asyncio.shield(fetch)
+
+    async def _fetch_once(self, url: str) -> Optional[str]:
+        cached = self._cached_page(url)
+        if cached is not None:
+            logging.debug("Using cached page for %s", url)
+            return cached
+        text = await self._fetch_remote(url)
+        if text is not None:
+            self._store_page(url, text)
+        return text
+
+    def _cached_page(self, url: str) -> Optional[str]:
+        if self._page_cache is None:
+            return None
+        row = self._page_cache.execute(
+            "SELECT body FROM pages WHERE url = ? AND status = 200 AND fetched_at > ?",
+            (url, time.time() - self.cache_ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def _store_page(self, url: str, text: str) -> None:
+        if self._page_cache is None:
+            return
+        body = zlib.compress(text.encode("utf-8"), 3)
+        self._page_cache.execute(
+            "INSERT OR REPLACE INTO pages (url, status, body, fetched_at) VALUES (?, ?, ?, ?)",
+            (url, 200, body, time.time()),
+        )
+        self._page_cache.commit()
+
+    async def _fetch_remote(self, url: str) -> Optional[str]:
+        assert self._client is not None and self._semaphore is not None
+        try:
+            host = urlsplit(url).netloc
+        except ValueError as exc:
+            logging.warning("Skipping invalid URL %r: %s", url, exc)
+            return None
+        async with self._semaphore:
+            for attempt in range(1, self.max_retries + 1):
+                await self._wait_for_host(host)
+                try:
+                    response = await self._client.get(url)
+                except (httpx.InvalidURL, httpx.UnsupportedProtocol, ValueError) as exc:
+                    logging.warning("Skipping invalid URL %r: %s", url, exc)
                     return None
-                self._sleep_backoff(attempt)
-                continue
-            text = response.text
-            if "HarvardKey - Sign In" in text or "login-form" in text:
-                logging.error(
-                    "Received a HarvardKey login page for %s. Provide a fresh cookie.",
-                    url,
-                )
+                except httpx.HTTPError as exc:
+                    logging.warning(
+                        "Request failed (%s/%s): %s", attempt, self.max_retries, exc
+                    )
+                    await self._sleep_backoff(attempt)
+                    continue
+                status = response.status_code
+                if status != 200:
+                    logging.warning(
+                        "Received HTTP %s for %s (attempt %s/%s)",
+                        status,
+                        url,
+                        attempt,
+                        self.max_retries,
+                    )
+                    if status in {401, 403}:
+                        logging.error("Authentication failed for %s. Check your cookie.", url)
+                        return None
+                    if status in {429, 503}:
+                        self._slow_down_host(host, response.headers)
+                    else:
+                        await self._sleep_backoff(attempt)
+                    continue
+                self._speed_up_host(host)
+                text = response.text
+                if (
+                    response.url.host in self.LOGIN_HOSTS
+                    or "HarvardKey - Sign In" in text
+                    or "login-form" in text
+                ):
+                    logging.error(
+                        "Received a HarvardKey login page for %s. Provide a fresh cookie.",
+                        url,
+                    )
+                    return None
+                return text
+        return None
+
+    async def _wait_for_host(self, host: str) -> None:
+        lock = self._host_locks.get(host)
+        if lock is None:
+            lock = self._host_locks[host] = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with lock:
+            wait = self._host_next_ok.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            interval = self._host_interval.get(host, self.delay)
+            self._host_next_ok[host] = loop.time() + interval
+
+    def _slow_down_host(self, host: str, headers: Mapping[str, str]) -> None:
+        """Back off a throttled host, honoring Retry-After/X-RateLimit hints."""
+        interval = self._host_interval.get(host, self.delay)
+        interval = min(max(interval * 2, 0.5), 10.0)
+        self._host_interval[host] = interval
+        pause = self._retry_after_seconds(headers)
+        if pause is None:
+            pause = interval
+        loop = asyncio.get_running_loop()
+        next_ok = loop.time() + min(pause, 300.0)
+        self._host_next_ok[host] = max(self._host_next_ok.get(host, 0.0), next_ok)
+        logging.info("Throttling %s: pausing %.1fs, interval now %.1fs", host, pause, interval)
+
+    def _speed_up_host(self, host: str) -> None:
+        """Halve a throttled host's interval back toward `delay` after a success."""
+        interval = self._host_interval.get(host)
+        if interval is None:
+            return
+        interval /= 2
+        if interval <= self.delay:
+            del self._host_interval[host]
+        else:
+            self._host_interval[host] = interval
+
+    @staticmethod
+    def _retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+        retry_after = (headers.get("Retry-After") or "").strip()
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+        remaining = (headers.get("X-RateLimit-Remaining") or "").strip()
+        reset = (headers.get("X-RateLimit-Reset") or "").strip()
+        if remaining == "0" and reset:
+            try:
+                value = float(reset)
+            except ValueError:
                 return None
-            return text
+            # Some servers send an epoch timestamp, others a delta in seconds.
+            if value > 1e9:
+                value -= time.time()
+            return max(0.0, value)
         return None
 
-    def _sleep_backoff(self, attempt: int) -> None:
+    async def _sleep_backoff(self, attempt: int) -> None:
         wait = min(self.delay * (2 ** (attempt - 1)), 10)
         if wait > 0:
-            time.sleep(wait)
+            await asyncio.sleep(wait)
 
-    def _extract_first_name(self, html: str, last_name: str) -> Optional[str]:
+    @classmethod
+    def _extract_first_name(cls, html: str, last_name: str) -> Optional[str]:
         if not last_name:
             return None
-        soup = BeautifulSoup(html, "html.parser")
-        candidates: Iterable[str] = self._candidate_text_chunks(soup)
+        normalized_last = cls._normalize_last_name(last_name).lower()
+        if normalized_last not in html.lower() and not cls.KEYWORD_RE.search(html):
+            return None
+        for match in cls.CONTEXT_RE.finditer(html):
+            first = cls._find_name_in_text(unescape(match.group("ctx")), last_name)
+            if first:
+                return first
+        soup = BeautifulSoup(html, "lxml", parse_only=cls.PARSE_ONLY)
+        candidates: Iterable[str] = cls._candidate_text_chunks(soup)
         for chunk in candidates:
-            first = self._find_name_in_text(chunk, last_name)
+            first = cls._find_name_in_text(chunk, last_name)
             if first:
                 return first
-        combined = self._first_n_characters(" ".join(soup.stripped_strings), 6000)
-        return self._find_name_in_text(combined, last_name)
+        full_soup = BeautifulSoup(html, "lxml")
+        combined = cls._first_n_from_iter(full_soup.stripped_strings, 6000)
+        return cls._find_name_in_text(combined, last_name)
 
-    def _candidate_text_chunks(self, soup: BeautifulSoup) -> Iterable[str]:
+    @classmethod
+    def _candidate_text_chunks(cls, soup: BeautifulSoup) -> Iterable[str]:
         seen: set[str] = set()
-        for selector in ("title", "h1", "h2", "h3"):
-            for node in soup.select(selector):
-                text = node.get_text(" ", strip=True)
-                if text and text not in seen:
-                    seen.add(text)
-                    yield text
-        for pattern in self.KEYWORD_PATTERNS:
-            for node in soup.find_all(string=pattern):
-                text = self._string_with_parent(node)
-                if text and text not in seen:
-                    seen.add(text)
-                    yield text
+        for node in soup.select("title, h1, h2, h3"):
+            text = node.get_text(" ", strip=True)
+            if text and text not in seen:
+                seen.add(text)
+                yield text
+        for node in soup.find_all(string=cls.KEYWORD_RE):
+            text = cls._string_with_parent(node)
+            if text and text not in seen:
+                seen.add(text)
+                yield text
 
     @staticmethod
     def _string_with_parent(node: NavigableString) -> str:
@@ -328,27 +660,33 @@ class HarvardQResolver:
         return str(node).strip()
 
     @staticmethod
-    def _first_n_characters(text: str, limit: int) -> str:
-        if len(text) <= limit:
-            return text
-        return text[:limit]
+    def _first_n_from_iter(strings: Iterable[str], limit: int) -> str:
+        """Join strings with spaces, stopping once `limit` characters are collected."""
+        parts: List[str] = []
+        length = 0
+        for text in strings:
+            parts.append(text)
+            length += len(text) + 1
+            if length > limit:
+                break
+        return " ".join(parts)[:limit]
 
-    def _find_name_in_text(self, text: str, last_name: str) -> Optional[str]:
+    @classmethod
+    def _find_name_in_text(cls, text: str, last_name: str) -> Optional[str]:
         if not text or not last_name:
             return None
         text_lower = text.lower()
-        normalized_last = self._normalize_last_name(last_name)
+        normalized_last = cls._normalize_last_name(last_name)
         if not normalized_last:
             return None
         if normalized_last.lower() not in text_lower:
             return None
-        pattern = self._build_name_pattern(normalized_last)
-        first = self._extract_from_pattern(pattern, text, require_capitalized=True)
+        pattern = cls._build_name_pattern(normalized_last)
+        first = cls._extract_from_pattern(pattern, text, require_capitalized=True)
         if first:
             return first
-        if any(hint in text_lower for hint in self.STRUCTURED_HINTS):
-            relaxed_pattern = self._build_name_pattern(normalized_last)
-            return self._extract_from_pattern(relaxed_pattern, text, require_capitalized=False)
+        if any(hint in text_lower for hint in cls.STRUCTURED_HINTS):
+            return cls._extract_from_pattern(pattern, text, require_capitalized=False)
         return None
 
     @staticmethod
@@ -363,28 +701,37 @@ class HarvardQResolver:
         return rf"{letter}(?:{letter}|['’\-]{letter})*"
 
     @classmethod
+    def _invalid_first_pattern(cls) -> str:
+        letter = cls.LETTER_CLASS
+        titles = "|".join(sorted(cls.INVALID_FIRST_TOKENS, key=len, reverse=True))
+        # A title only counts when it is the whole token ("Dr", not "Drew").
+        return rf"(?i:{titles})(?!{letter}|['’\-]{letter})"
+
+    @classmethod
+    @functools.lru_cache(maxsize=2048)
     def _build_name_pattern(cls, last_name: str) -> re.Pattern[str]:
         escaped_last = re.escape(last_name.strip())
         token = cls._token_pattern()
-        first = rf"(?P<first>{token})(?:\.)?"
+        # Titles are rejected by the regex itself, so "Professor Jane Doe"
+        # matches "Jane" instead of consuming the title as the first name.
+        first = rf"(?!{cls._invalid_first_pattern()})(?P<first>{token})(?:\.)?"
         middle = rf"(?:{token}(?:\.)?\s+){{0,3}}"
         regex = rf"\b{first}\s+{middle}(?i:{escaped_last})(?!{cls.LETTER_CLASS})"
         return re.compile(regex)
 
+    @classmethod
     def _extract_from_pattern(
-        self, pattern: re.Pattern[str], text: str, require_capitalized: bool
+        cls, pattern: re.Pattern[str], text: str, require_capitalized: bool
     ) -> Optional[str]:
         for match in pattern.finditer(text):
             candidate = match.group("first")
             if not candidate:
                 continue
-            cleaned = self._clean_candidate(candidate)
+            cleaned = cls._clean_candidate(candidate)
             if not cleaned:
                 continue
             if require_capitalized and not cleaned[:1].isupper():
                 continue
-            if cleaned.lower() in self.INVALID_FIRST_TOKENS:
-                continue
             return cleaned
         return None
 
@@ -402,6 +749,11 @@ class HarvardQResolver:
         return candidate[0].upper() + candidate[1:]
 
 
+def extract_first_name(html: str, last_name: str) -> Optional[str]:
+    """Module-level entry point so parsing can run in a ProcessPoolExecutor."""
+    return HarvardQResolver._extract_first_name(html, last_name)
+
+
 def process_rows(
     input_path: Path,
     output_path: Path,
@@ -410,43 +762,153 @@ def process_rows(
     reuse_existing_first_names: bool = True,
     limit: Optional[int] = None,
 ) -> int:
-    with input_path.open(newline="", encoding="utf-8") as src:
-        reader = csv.DictReader(src)
-        fieldnames = list(reader.fieldnames or [])
-        new_column = "course_teacher_first_name"
-        if new_column not in fieldnames:
-            fieldnames.append(new_column)
-        sex_column = "course_teacher_sex"
-        if sex_column not in fieldnames:
-            fieldnames.append(sex_column)
-        rows = list(reader)
-
-    for idx, row in enumerate(rows, start=1):
-        if limit is not None and idx > limit:
-            row[new_column] = row.get(new_column, "")
-            continue
-        last_name = (row.get("course_teacher") or "").strip()
-        link = (row.get("link") or "").strip()
-        if not last_name:
-            logging.warning("Row %s lacks a course_teacher value; skipping.", idx)
-            continue
-        first_name = (row.get(new_column) or "").strip()
-        if not first_name or not reuse_existing_first_names:
-            first_name = resolver.resolve(link, last_name) or ""
-        row[new_column] = first_name
-        existing_sex = (row.get("course_teacher_sex") or "").strip()
-        if existing_sex:
-            row["course_teacher_sex"] = existing_sex
-        else:
-            row["course_teacher_sex"] = guess_sex(first_name, gender_detector)
-        if idx % 25 == 0:
-            logging.info("Processed %s rows (last: %s %s)", idx, first_name or "?", last_name)
+    # Write to a temporary file beside the output and move it into place only
+    # once every row is written, so `-o` may name the input file itself and an
+    # aborted run never leaves a truncated CSV behind.
+    tmp_fd, tmp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with contextlib.ExitStack() as stack:
+            dst = stack.enter_context(
+                os.fdopen(
+                    tmp_fd,
+                    "w",
+                    newline="",
+                    encoding="utf-8",
+                    buffering=OUTPUT_BUFFER_SIZE,
+                )
+            )
+            src = stack.enter_context(input_path.open(newline="", encoding="utf-8"))
+            reader = csv.DictReader(src)
+            fieldnames = list(reader.fieldnames or [])
+            for column in (FIRST_NAME_COLUMN, SEX_COLUMN):
+                if column not in fieldnames:
+                    fieldnames.append(column)
+            writer = csv.DictWriter(dst, fieldnames=fieldnames)
+            writer.writeheader()
+            rows: Iterable[Dict[str, str]] = itertools.islice(reader, limit)
+            written = asyncio.run(
+                _stream_rows(
+                    rows,
+                    writer,
+                    resolver,
+                    gender_detector,
+                    reuse_existing_first_names,
+                )
+            )
+        # mkstemp creates the file owner-only; give it the permissions a
+        # plain open() would have.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return written
+
+
+async def _stream_rows(
+    rows: Iterable[Dict[str, str]],
+    writer: "csv.DictWriter[str]",
+    resolver: HarvardQResolver,
+    gender_detector: Optional["Detector"],
+    reuse_existing_first_names: bool,
+) -> int:
+    """Feed rows through resolver workers to a single writer, keeping input order.
+
+    The reader puts each row on a bounded work queue for the workers and its
+    completion future on a bounded ordered queue for the writer, so at most a
+    few hundred rows are held in memory regardless of the CSV size.
+    """
+    work: asyncio.Queue = asyncio.Queue(maxsize=ROW_QUEUE_SIZE)
+    ordered: asyncio.Queue = asyncio.Queue(maxsize=ROW_QUEUE_SIZE)
+    loop = asyncio.get_running_loop()
+
+    async def read() -> None:
+        for idx, row in enumerate(rows, start=1):
+            done: "asyncio.Future[None]" = loop.create_future()
+            await ordered.put((row, done))
+            await work.put((idx, row, done))
+        await ordered.put(None)
+        for _ in range(resolver.concurrency):
+            await work.put(None)
+
+    async def annotate() -> None:
+        while True:
+            item = await work.get()
+            if item is None:
+                return
+            idx, row, done = item
+            try:
+                await _annotate_row(
+                    idx, row, resolver, gender_detector, reuse_existing_first_names
+                )
+            except Exception as exc:
+                done.set_exception(exc)
+            else:
+                done.set_result(None)
+
+    async def write() -> int:
+        written = 0
+        while True:
+            item = await ordered.get()
+            if item is None:
+                return written
+            row, done = item
+            await done
+            writer.writerow(row)
+            written += 1
+            if written % 25 == 0:
+                logging.info(
+                    "Processed %s rows (last: %s %s)",
+                    written,
+                    row.get(FIRST_NAME_COLUMN) or "?",
+                    row.get("course_teacher") or "",
+                )
 
-    with output_path.open("w", newline="", encoding="utf-8") as dst:
-        writer = csv.DictWriter(dst, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    return len(rows)
+    async with resolver.connect():
+        workers = [asyncio.create_task(annotate()) for _ in range(resolver.concurrency)]
+        reader_task = asyncio.create_task(read())
+        writer_task = asyncio.create_task(write())
+        try:
+            # A failing reader never sends the writer its end-of-input marker,
+            # so wait on both and surface whichever fails first.
+            done, _ = await asyncio.wait(
+                {reader_task, writer_task}, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                task.result()
+            await asyncio.gather(*workers)
+        finally:
+            for task in (reader_task, writer_task, *workers):
+                task.cancel()
+    return writer_task.result()
+
+
+async def _annotate_row(
+    idx: int,
+    row: Dict[str, str],
+    resolver: HarvardQResolver,
+    gender_detector: Optional["Detector"],
+    reuse_existing_first_names: bool,
+) -> None:
+    last_name = (row.get("course_teacher") or "").strip()
+    if not last_name:
+        logging.warning("Row %s lacks a course_teacher value; skipping.", idx)
+        return
+    first_name = (row.get(FIRST_NAME_COLUMN) or "").strip()
+    if not (first_name and reuse_existing_first_names):
+        link = (row.get("link") or "").strip()
+        first_name = await resolver.resolve(link, last_name) or ""
+    row[FIRST_NAME_COLUMN] = first_name
+    existing_sex = (row.get(SEX_COLUMN) or "").strip()
+    if existing_sex:
+        row[SEX_COLUMN] = existing_sex
+    else:
+        row[SEX_COLUMN] = guess_sex(first_name, gender_detector)
 
 
 def main() -> None:
@@ -455,6 +917,8 @@ def main() -> None:
         level=getattr(logging, args.log_level.upper(), logging.INFO),
         format="%(levelname)s %(message)s",
     )
+    # httpx logs every request at INFO, which drowns out the progress output.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     input_path = Path(args.input)
     if not input_path.exists():
         logging.error("Input file %s does not exist.", input_path)
@@ -477,16 +941,32 @@ def main() -> None:
         logging.info(
             "No cookie argument or HARVARD_Q_COOKIE detected; falling back to DEFAULT_COOKIE."
         )
-    resolver = HarvardQResolver(cookie_header=cookie, delay=args.delay, max_retries=args.max_retries)
-    gender_detector = build_gender_detector()
-    processed = process_rows(
-        input_path=input_path,
-        output_path=output_path,
-        resolver=resolver,
-        gender_detector=gender_detector,
-        reuse_existing_first_names=not args.no_reuse_first_names,
-        limit=args.limit,
+    if args.no_cache:
+        cache_path = None
+    elif args.cache_path:
+        cache_path = Path(args.cache_path)
+    else:
+        cache_path = input_path.with_name("harvard_q_cache.sqlite3")
+    resolver = HarvardQResolver(
+        cookie_header=cookie,
+        delay=args.delay,
+        max_retries=args.max_retries,
+        concurrency=args.concurrency,
+        cache_path=cache_path,
+        cache_ttl=args.cache_ttl * 24 * 3600,
     )
+    gender_detector = build_gender_detector()
+    try:
+        processed = process_rows(
+            input_path=input_path,
+            output_path=output_path,
+            resolver=resolver,
+            gender_detector=gender_detector,
+            reuse_existing_first_names=not args.no_reuse_first_names,
+            limit=args.limit,
+        )
+    finally:
+        resolver.close()
     logging.info("Wrote %s rows to %s", processed, output_path)
 
 